@@ -0,0 +1,102 @@
+"""Mixed read/write throughput against SQLite, default settings vs. the
+WAL-tuned engine from src.dashboard.database.
+
+    python -m benchmarks.db_concurrency --threads 16 --seconds 5
+"""
+import argparse
+import os
+import random
+import secrets
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from src.dashboard.database import Base, LicenseEntry, LicenseTokenStore, create_db_engine
+
+def _seed(SessionLocal, companies: int):
+    db = SessionLocal()
+    now = datetime.now(timezone.utc)
+    for i in range(companies):
+        name = f"Company{i}"
+        db.add(LicenseEntry(countrycode="PK", companyname=name, license_type="Reseller",
+                            hash_value=str(i), device_limit="5", validity="30"))
+        db.add(LicenseTokenStore(company_name=name, token=secrets.token_hex(16),
+                                 created_at=now, expired_at=now + timedelta(days=30)))
+    db.commit()
+    db.close()
+
+def _worker(SessionLocal, companies, write_ratio, deadline, stats, lock):
+    reads = writes = errors = 0
+    rng = random.Random()
+    while time.perf_counter() < deadline:
+        db = SessionLocal()
+        name = f"Company{rng.randrange(companies)}"
+        try:
+            if rng.random() < write_ratio:
+                token_entry = db.query(LicenseTokenStore).filter_by(company_name=name).first()
+                token_entry.is_active = True
+                token_entry.activation_time = datetime.now(timezone.utc)
+                token_entry.activated_by = f"{secrets.token_hex(4)}@example.com"
+                db.commit()
+                writes += 1
+            else:
+                db.query(LicenseEntry).filter_by(companyname=name).first()
+                db.query(LicenseTokenStore).filter_by(company_name=name).all()
+                reads += 1
+        except OperationalError:
+            db.rollback()
+            errors += 1
+        finally:
+            db.close()
+
+    with lock:
+        stats["reads"] += reads
+        stats["writes"] += writes
+        stats["errors"] += errors
+
+def run(label, db_engine, threads, seconds, write_ratio, companies=200):
+    Base.metadata.create_all(bind=db_engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+    _seed(SessionLocal, companies)
+
+    stats = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+    workers = [
+        threading.Thread(target=_worker, args=(SessionLocal, companies, write_ratio, deadline, stats, lock))
+        for _ in range(threads)
+    ]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    db_engine.dispose()
+
+    ops = stats["reads"] + stats["writes"]
+    print(f"{label:<10} {ops / seconds:>10.1f} ops/s  "
+          f"reads={stats['reads']} writes={stats['writes']} locked={stats['errors']}")
+    return ops / seconds
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        default_url = "sqlite:///" + os.path.join(tmp, "default.db")
+        tuned_url = "sqlite:///" + os.path.join(tmp, "tuned.db")
+
+        baseline = run("default", create_engine(default_url, connect_args={"check_same_thread": False}),
+                       args.threads, args.seconds, args.write_ratio)
+        tuned = run("wal-tuned", create_db_engine(tuned_url),
+                    args.threads, args.seconds, args.write_ratio)
+
+    print(f"speedup    {tuned / baseline:>10.2f}x")
+
+if __name__ == "__main__":
+    main()
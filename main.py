@@ -1,11 +1,20 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from src.dashboard.api import router as dashboard_router
+from src.dashboard.assets import AssetStaticFiles, build_assets
+from src.dashboard.audit import audit_log
 import uvicorn
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    audit_log.start()
+    yield
+    audit_log.stop()
 
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app = FastAPI(lifespan=lifespan)
+
+build_assets()
+app.mount("/static", AssetStaticFiles(directory="static"), name="static")
 
 app.include_router(dashboard_router)
 
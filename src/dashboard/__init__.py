@@ -1 +1,7 @@
-from .api import router
\ No newline at end of file
+def __getattr__(name):
+    # Importing api runs init_db(); defer it so submodules such as
+    # database can be imported (e.g. by benchmarks) without app setup.
+    if name == "router":
+        from .api import router
+        return router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,23 +1,29 @@
-import os
 import secrets
 from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
 from fastapi import APIRouter, Form, Request, status, Depends, HTTPException
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
+from typing import Optional
+from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, Response
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from sqlalchemy.orm import Session
 from src.dashboard.models import ActivateLicense,TrialLicense
 from src.dashboard.database import SessionLocal, init_db, User, SessionToken, LicenseEntry,LicenseTokenStore
+from src.dashboard.assets import asset_url
+from src.dashboard.reference_data import countries, is_valid_country_code, license_type_flag
+from src.dashboard.audit import audit_log, query_events
 import subprocess
-import json
 
 load_dotenv()
 init_db()
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
-ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..",".."))
-COUNTRY_CODES_PATH = os.path.join(ROOT_DIR, "country_code.json")
+templates = Jinja2Templates(env=Environment(
+    loader=FileSystemLoader("templates"),
+    autoescape=True,
+    bytecode_cache=FileSystemBytecodeCache(),
+))
+templates.env.globals["asset_url"] = asset_url
 
 def get_db():
     db = SessionLocal()
@@ -26,20 +32,40 @@ def get_db():
     finally:
         db.close()
 
-def is_valid_country_code(code: str) -> bool:
-    try:
-        with open(COUNTRY_CODES_PATH, "r") as f:
-            countries = json.load(f)
-        valid_codes = {entry["code"].upper() for entry in countries}
-        return code.upper() in valid_codes
-    except Exception as e:
-        print(f"Error loading country codes: {e}")
-        return False
+def get_valid_session(request: Request, db: Session) -> Optional[SessionToken]:
+    token = request.cookies.get("session_token")
+    if not token:
+        return None
+    session = db.query(SessionToken).filter_by(token=token).first()
+    if not session or session.expires_at < datetime.utcnow():
+        return None
+    return session
+
+def get_session_email(request: Request, db: Session) -> Optional[str]:
+    token = request.cookies.get("session_token")
+    if not token:
+        return None
+    session = db.query(SessionToken).filter_by(token=token).first()
+    return session.email if session else None
 
 @router.get("/", response_class=HTMLResponse)
 async def login_get(request: Request, error: str = None):
     return templates.TemplateResponse("login.html", {"request": request, "error": error})
 
+@router.get("/countries")
+async def get_countries(request: Request):
+    data = countries.get()
+    # no-cache: clients may store the list but must revalidate, so a reload
+    # of country_code.json is picked up on the next request via a cheap 304.
+    headers = {"ETag": data.etag, "Cache-Control": "no-cache"}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    if "*" in tags or data.etag in tags:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=data.body, media_type="application/json", headers=headers)
+
 @router.post("/login")
 async def login_post(request: Request,email: str = Form(...), password: str = Form(...), db: Session = Depends(get_db)):
     user = db.query(User).filter_by(email=email, password=password).first()
@@ -52,6 +78,7 @@ async def login_post(request: Request,email: str = Form(...), password: str = Fo
         session_token = SessionToken(email=email, token=token, created_at=now, expires_at=expires_at)
         db.add(session_token)
         db.commit()
+        audit_log.emit("session.login", actor=email)
 
         response = RedirectResponse(url=request.url_for("dashboard"), status_code=status.HTTP_302_FOUND)
         response.set_cookie(key="session_token", value=token, httponly=True)
@@ -68,6 +95,7 @@ async def logout(request: Request, db: Session = Depends(get_db)):
         if session:
             db.delete(session)
             db.commit()
+            audit_log.emit("session.logout", actor=session.email)
 
     response = RedirectResponse(url=request.url_for("login_get"), status_code=status.HTTP_302_FOUND)
     response.delete_cookie("session_token")
@@ -75,14 +103,7 @@ async def logout(request: Request, db: Session = Depends(get_db)):
 
 @router.get("/dashboard", response_class=HTMLResponse)
 async def dashboard(request: Request, db: Session = Depends(get_db)):
-    token = request.cookies.get("session_token")
-
-    if not token:
-        return RedirectResponse(url=request.url_for("login_get"), status_code=status.HTTP_302_FOUND)
-
-    session = db.query(SessionToken).filter_by(token=token).first()
-
-    if not session or session.expires_at < datetime.utcnow():
+    if not get_valid_session(request, db):
         return RedirectResponse(url=request.url_for("login_get"), status_code=status.HTTP_302_FOUND)
 
     licenses = db.query(LicenseEntry).all()
@@ -94,6 +115,7 @@ async def dashboard(request: Request, db: Session = Depends(get_db)):
 
 @router.post("/add_license")
 async def add_license(
+    request: Request,
     countrycode: str = Form(...),
     companyname: str = Form(...),
     license_type: str = Form(...),
@@ -120,23 +142,25 @@ async def add_license(
             msg = "A license with this hash_value already exists."
         return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"message": msg})
 
-    # ✅ Step 3: Validate license type
-    if license_type.lower() == "distributor":
-        license_type_flag = 1
-    elif license_type.lower() == "reseller":
-        license_type_flag = 0
-    else:
+    # ✅ Step 3: Validate license type and validity
+    type_flag = license_type_flag(license_type)
+    if type_flag is None:
         return JSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={"message": "Invalid license_type. Must be 'Distributor' or 'Reseller'."}
         )
 
+    try:
+        validity_days = int(validity)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid validity value")
+
     # ✅ Step 4: Generate token using subprocess
     try:
         result = subprocess.run(
             [
                 "java", "-jar", "cyber.jar",
-                countrycode, companyname, str(license_type_flag),
+                countrycode, companyname, str(type_flag),
                 validity, hash_value, str(device_limit)
             ],
             capture_output=True, text=True, timeout=30
@@ -164,11 +188,6 @@ async def add_license(
     db.commit()
 
     # ✅ Step 6: Calculate expiry
-    try:
-        validity_days = int(validity)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid validity value")
-
     now = datetime.now(timezone.utc)
     expiry_date = now + timedelta(days=validity_days)
 
@@ -181,6 +200,17 @@ async def add_license(
     db.add(license_token)
     db.commit()
 
+    audit_log.emit(
+        "license.add",
+        actor=get_session_email(request, db),
+        license_id=new_license.id,
+        company_name=companyname,
+        countrycode=countrycode,
+        license_type=license_type,
+        device_limit=device_limit,
+        validity=validity,
+    )
+
     return JSONResponse(
         status_code=status.HTTP_201_CREATED,
         content={
@@ -304,7 +334,7 @@ async def get_licenses(db: Session = Depends(get_db), request: Request = None):
     return JSONResponse(content=result)
 
 @router.delete("/delete_license/{license_id}")
-async def delete_license(license_id: int, db: Session = Depends(get_db)):
+async def delete_license(license_id: int, request: Request, db: Session = Depends(get_db)):
     license_entry = db.query(LicenseEntry).filter_by(id=license_id).first()
 
     if not license_entry:
@@ -315,6 +345,13 @@ async def delete_license(license_id: int, db: Session = Depends(get_db)):
     db.delete(license_entry)
     db.commit()
 
+    audit_log.emit(
+        "license.delete",
+        actor=get_session_email(request, db),
+        license_id=license_id,
+        company_name=license_entry.companyname,
+    )
+
     return JSONResponse(
         status_code=status.HTTP_200_OK,
         content={
@@ -400,6 +437,7 @@ async def view_license(license_id: int, db: Session = Depends(get_db)):
 @router.post("/edit_license/{license_id}")
 async def edit_license(
     license_id: int,
+    request: Request,
     license_type: str = Form(...),
     device_limit: int = Form(...),
     validity: str = Form(...),
@@ -414,16 +452,8 @@ async def edit_license(
     except ValueError:
         return JSONResponse(status_code=400, content={"message": "Invalid validity value"})
 
-    license_entry.license_type = license_type
-    license_entry.device_limit = str(device_limit)
-    license_entry.validity = validity
-    db.commit()
-
-    if license_type.lower() == "distributor":
-        license_type_flag = 1
-    elif license_type.lower() == "reseller":
-        license_type_flag = 0
-    else:
+    type_flag = license_type_flag(license_type)
+    if type_flag is None:
         return JSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={"message": "Invalid license_type. Must be 'Distributor' or 'Reseller'."}
@@ -438,7 +468,7 @@ async def edit_license(
                 "java", "-jar", "cyber.jar",
                 license_entry.countrycode,
                 license_entry.companyname,
-                str(license_type_flag),
+                str(type_flag),
                 validity,
                 license_entry.hash_value,
                 str(device_limit)
@@ -455,6 +485,10 @@ async def edit_license(
             content={"message": f"Failed to generate token: {e}"}
         )
 
+    license_entry.license_type = license_type
+    license_entry.device_limit = str(device_limit)
+    license_entry.validity = validity
+
     license_token = LicenseTokenStore(
         company_name=license_entry.companyname,
         token=new_token,
@@ -465,6 +499,16 @@ async def edit_license(
     db.add(license_token)
     db.commit()
 
+    audit_log.emit(
+        "license.edit",
+        actor=get_session_email(request, db),
+        license_id=license_entry.id,
+        company_name=license_entry.companyname,
+        license_type=license_type,
+        device_limit=device_limit,
+        validity=validity,
+    )
+
     return JSONResponse(
         status_code=200,
         content={
@@ -522,6 +566,13 @@ def activate_license_by_hash(db: Session, hash_value: str, email: str = "") -> b
     token_entry.activation_time = datetime.now(timezone.utc)
     token_entry.activated_by = email
     db.commit()
+
+    audit_log.emit(
+        "license.activate",
+        actor=email or None,
+        license_id=license_entry.id,
+        company_name=license_entry.companyname,
+    )
     return True
 
 @router.post("/activate_license")
@@ -569,11 +620,14 @@ async def trail_license(
     except ValueError:
         return JSONResponse(status_code=400, content={"message": "Invalid validity value"})
 
-    if license_type.lower() == "distributor":
-        license_type_flag = "1"
-    elif license_type.lower() == "reseller":
-        license_type_flag = "0"
-    else:
+    if not is_valid_country_code(countrycode):
+        return JSONResponse(
+            status_code=400,
+            content={"message": "Invalid country code. Please provide a valid ISO 3166-1 code."}
+        )
+
+    type_flag = license_type_flag(license_type)
+    if type_flag is None:
         return JSONResponse(
             status_code=400,
             content={"message": "Invalid license_type. Must be 'Distributor' or 'Reseller'."}
@@ -583,7 +637,7 @@ async def trail_license(
         result = subprocess.run(
             [
                 "java", "-jar", "cyber.jar",
-                countrycode, companyname, license_type_flag, validity, hash_value, device_limit
+                countrycode, companyname, str(type_flag), validity, hash_value, device_limit
             ],
             capture_output=True, text=True, timeout=30
         )
@@ -631,6 +685,17 @@ async def trail_license(
     db.add(license_token)
     db.commit()
 
+    audit_log.emit(
+        "license.trial",
+        actor=email,
+        license_id=new_license.id,
+        company_name=companyname,
+        countrycode=countrycode,
+        license_type=license_type,
+        device_limit=device_limit,
+        validity=validity,
+    )
+
     activated = activate_license_by_hash(db, hash_value, email)
     if activated:
         return JSONResponse(
@@ -641,4 +706,39 @@ async def trail_license(
         return JSONResponse(
             status_code=200,
             content={"message": "License created but not activated", "license_key": license_key}
-        )
\ No newline at end of file
+        )
+
+@router.get("/audit_events")
+def get_audit_events(
+    request: Request,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    action: Optional[str] = None,
+    actor: Optional[str] = None,
+    company_name: Optional[str] = None,
+    before_id: Optional[int] = None,
+    limit: int = 50,
+    db: Session = Depends(get_db)
+):
+    if not get_valid_session(request, db):
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    # Make events still sitting in the buffer visible to this read. This is
+    # a plain def so FastAPI runs it (and this flush) in the threadpool.
+    # Failures here don't count towards the writer's retry budget.
+    audit_log.flush(count_failures=False)
+
+    result = query_events(
+        db,
+        since=since,
+        until=until,
+        action=action,
+        actor=actor,
+        company_name=company_name,
+        before_id=before_id,
+        limit=limit,
+    )
+    # Events lost to buffer overflow or exhausted retries since startup, so
+    # readers can tell when the trail is incomplete.
+    result["dropped"] = audit_log.dropped
+    return JSONResponse(content=result)
\ No newline at end of file
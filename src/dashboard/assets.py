@@ -0,0 +1,154 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from mimetypes import guess_type
+from fastapi.responses import FileResponse
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.staticfiles import NotModifiedResponse
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+STATIC_DIR = os.path.join(ROOT_DIR, "static")
+BUILD_DIR = os.path.join(STATIC_DIR, "dist")
+STATIC_URL = "/static"
+
+COMPRESSIBLE_EXTENSIONS = {".css", ".js", ".json", ".svg", ".txt", ".html"}
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+PRECOMPRESSED_VARIANTS = (("br", ".br"), ("gzip", ".gz"))
+
+# logical path (relative to static/) -> fingerprinted path (relative to static/)
+manifest = {}
+
+def _fingerprint(rel_path: str, content: bytes) -> str:
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    root, ext = os.path.splitext(rel_path)
+    return f"{root}.{digest}{ext}"
+
+def _file_mode() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+def _write_atomic(path: str, content: bytes):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        # mkstemp creates 0600 files; give them normal permissions so a
+        # proxy or another worker user can serve them.
+        os.chmod(tmp_path, _file_mode())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def build_assets(static_dir: str = STATIC_DIR, build_dir: str = BUILD_DIR) -> dict:
+    # Outputs are content-addressed, so the build is idempotent: existing
+    # targets are left alone and new ones are written via rename. This keeps
+    # concurrent workers building at startup from clobbering each other, and
+    # previously built hashes stay servable to pages rendered before a deploy.
+    os.makedirs(build_dir, exist_ok=True)
+
+    built = {}
+    for dirpath, dirnames, filenames in os.walk(static_dir):
+        if os.path.abspath(dirpath) == os.path.abspath(static_dir):
+            dirnames[:] = [d for d in dirnames if os.path.join(dirpath, d) != build_dir]
+        for filename in filenames:
+            source = os.path.join(dirpath, filename)
+            rel_path = os.path.relpath(source, static_dir).replace(os.sep, "/")
+            with open(source, "rb") as f:
+                content = f.read()
+
+            hashed_path = _fingerprint(rel_path, content)
+            target = os.path.join(build_dir, *hashed_path.split("/"))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if not os.path.exists(target):
+                _write_atomic(target, content)
+
+            if os.path.splitext(filename)[1].lower() in COMPRESSIBLE_EXTENSIONS:
+                if not os.path.exists(target + ".gz"):
+                    _write_atomic(target + ".gz", gzip.compress(content, compresslevel=9, mtime=0))
+                if brotli is not None and not os.path.exists(target + ".br"):
+                    _write_atomic(target + ".br", brotli.compress(content, quality=11))
+
+            built[rel_path] = os.path.relpath(target, static_dir).replace(os.sep, "/")
+
+    _write_atomic(
+        os.path.join(build_dir, "manifest.json"),
+        json.dumps(built, indent=2, sort_keys=True).encode(),
+    )
+
+    manifest.clear()
+    manifest.update(built)
+    return built
+
+def asset_url(path: str) -> str:
+    path = path.lstrip("/")
+    return f"{STATIC_URL}/{manifest.get(path, path)}"
+
+def _accepted_encodings(accept_encoding: str) -> set:
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if q > 0:
+            accepted.add(coding)
+    return accepted
+
+class AssetStaticFiles(StaticFiles):
+    """StaticFiles that serves fingerprinted build output with an immutable
+    Cache-Control, preferring a precompressed variant the client accepts."""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        full_path = os.path.abspath(full_path)
+        if os.path.commonpath([full_path, BUILD_DIR]) != BUILD_DIR:
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        # Precompressed variants are only served through content negotiation
+        # on the original path, never directly.
+        root, ext = os.path.splitext(full_path)
+        if any(ext == suffix for _, suffix in PRECOMPRESSED_VARIANTS):
+            if os.path.splitext(root)[1].lower() in COMPRESSIBLE_EXTENSIONS:
+                raise HTTPException(status_code=404)
+
+        request_headers = Headers(scope=scope)
+        headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL}
+        media_type = guess_type(full_path)[0] or "text/plain"
+
+        if os.path.splitext(full_path)[1].lower() in COMPRESSIBLE_EXTENSIONS:
+            headers["Vary"] = "Accept-Encoding"
+            accepted = _accepted_encodings(request_headers.get("accept-encoding", ""))
+            for coding, suffix in PRECOMPRESSED_VARIANTS:
+                variant = full_path + suffix
+                if coding in accepted and os.path.isfile(variant):
+                    full_path, stat_result = variant, os.stat(variant)
+                    headers["Content-Encoding"] = coding
+                    break
+
+        response = FileResponse(
+            full_path,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            stat_result=stat_result,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -0,0 +1,185 @@
+import json
+import os
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from src.dashboard.database import SessionLocal, AuditEvent
+
+AUDIT_BUFFER_SIZE = int(os.getenv("AUDIT_BUFFER_SIZE", "10000"))
+AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", "500"))
+AUDIT_FLUSH_INTERVAL = float(os.getenv("AUDIT_FLUSH_INTERVAL", "1.0"))
+AUDIT_MAX_RETRIES = int(os.getenv("AUDIT_MAX_RETRIES", "5"))
+AUDIT_MAX_PAGE_SIZE = 500
+
+class AuditLog:
+    """Append-only audit trail. Request handlers push events into an
+    in-memory ring buffer; a background thread writes them to the
+    audit_events table in batches, one commit per batch."""
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        capacity: int = AUDIT_BUFFER_SIZE,
+        batch_size: int = AUDIT_BATCH_SIZE,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL,
+        max_retries: int = AUDIT_MAX_RETRIES,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.dropped = 0
+        self._failures = 0
+        self._buffer = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def emit(self, action: str, actor: str = None, license_id: int = None, company_name: str = None, **details):
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1
+            self._buffer.append({
+                # naive UTC, like SessionToken; the column has no timezone
+                "occurred_at": datetime.utcnow(),
+                "action": action,
+                "actor": actor,
+                "license_id": license_id,
+                "company_name": company_name,
+                "details": json.dumps(details, default=str) if details else None,
+            })
+            pending = len(self._buffer)
+
+        if pending >= self.batch_size:
+            self._wakeup.set()
+
+    def flush(self, count_failures: bool = True) -> int:
+        """Write out buffered events. Only the background writer counts
+        failures towards max_retries; opportunistic flushes from readers
+        pass count_failures=False so they cannot exhaust the retries."""
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                if not batch:
+                    return written
+
+                try:
+                    self._write(batch)
+                except Exception as e:
+                    if count_failures:
+                        self._failures += 1
+                    if self._failures >= self.max_retries:
+                        self._failures = 0
+                        with self._lock:
+                            self.dropped += len(batch)
+                        print(f"Error writing audit events, dropping batch of {len(batch)}: {e}")
+                    else:
+                        with self._lock:
+                            # extendleft on a full deque evicts the newest events
+                            evicted = max(0, len(self._buffer) + len(batch) - self._buffer.maxlen)
+                            self.dropped += evicted
+                            self._buffer.extendleft(reversed(batch))
+                        print(f"Error writing audit events, will retry: {e}")
+                    return written
+
+                self._failures = 0
+                written += len(batch)
+
+    def _write(self, batch):
+        db = self.session_factory()
+        try:
+            db.execute(insert(AuditEvent), batch)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._flush_safely()
+        self._flush_safely()
+
+    def _flush_safely(self):
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"Audit writer error: {e}")
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+def query_events(
+    db: Session,
+    since: datetime = None,
+    until: datetime = None,
+    action: str = None,
+    actor: str = None,
+    company_name: str = None,
+    before_id: int = None,
+    limit: int = 50,
+):
+    """Newest-first page of events. Ids are assigned in emission order, so
+    `before_id` (the last id of the previous page) is a stable cursor."""
+    query = db.query(AuditEvent)
+    if since:
+        query = query.filter(AuditEvent.occurred_at >= _as_naive_utc(since))
+    if until:
+        query = query.filter(AuditEvent.occurred_at < _as_naive_utc(until))
+    if action:
+        query = query.filter(AuditEvent.action == action)
+    if actor:
+        query = query.filter(AuditEvent.actor == actor)
+    if company_name:
+        query = query.filter(AuditEvent.company_name == company_name)
+    if before_id:
+        query = query.filter(AuditEvent.id < before_id)
+
+    limit = max(1, min(limit, AUDIT_MAX_PAGE_SIZE))
+    events = query.order_by(AuditEvent.id.desc()).limit(limit + 1).all()
+    has_more = len(events) > limit
+    events = events[:limit]
+
+    return {
+        "events": [_serialize(event) for event in events],
+        "next_before_id": events[-1].id if has_more else None,
+    }
+
+def _as_naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+def _serialize(event: AuditEvent) -> dict:
+    return {
+        "id": event.id,
+        "occurred_at": event.occurred_at.replace(tzinfo=timezone.utc).isoformat(),
+        "action": event.action,
+        "actor": event.actor,
+        "license_id": event.license_id,
+        "company_name": event.company_name,
+        "details": json.loads(event.details) if event.details else None,
+    }
+
+audit_log = AuditLog()
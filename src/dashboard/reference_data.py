@@ -0,0 +1,100 @@
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+COUNTRY_CODES_PATH = os.path.join(ROOT_DIR, "country_code.json")
+
+# license type (lowercase) -> flag passed to cyber.jar
+LICENSE_TYPES: Mapping[str, int] = MappingProxyType({
+    "distributor": 1,
+    "reseller": 0,
+})
+
+@dataclass(frozen=True)
+class CountryData:
+    mtime_ns: int
+    codes: frozenset
+    names: Mapping[str, str]
+    entries: Tuple[Mapping[str, str], ...]
+    body: bytes
+    etag: str
+
+def _load_countries(path: str) -> CountryData:
+    mtime_ns = os.stat(path).st_mtime_ns
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    entries = tuple(
+        MappingProxyType({"name": entry["name"], "code": entry["code"].upper()})
+        for entry in json.loads(raw)
+    )
+    names = {entry["code"]: entry["name"] for entry in entries}
+    body = json.dumps([dict(entry) for entry in entries], separators=(",", ":")).encode()
+
+    return CountryData(
+        mtime_ns=mtime_ns,
+        codes=frozenset(names),
+        names=MappingProxyType(names),
+        entries=entries,
+        body=body,
+        etag='"' + hashlib.sha256(body).hexdigest()[:32] + '"',
+    )
+
+class CountryRegistry:
+    """Country codes loaded once into immutable lookups and swapped in
+    whole when the backing file's mtime changes."""
+
+    def __init__(self, path: str = COUNTRY_CODES_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data: Optional[CountryData] = None
+        self._failed_mtime_ns: Optional[int] = None
+
+    def get(self) -> CountryData:
+        data = self._data
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError as e:
+            if data is None:
+                raise
+            print(f"Error checking country codes: {e}")
+            return data
+
+        if data is not None and mtime_ns in (data.mtime_ns, self._failed_mtime_ns):
+            return data
+
+        with self._lock:
+            data = self._data
+            if data is not None and mtime_ns in (data.mtime_ns, self._failed_mtime_ns):
+                return data
+            try:
+                self._data = _load_countries(self.path)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                if data is None:
+                    raise
+                self._failed_mtime_ns = mtime_ns
+                print(f"Error reloading country codes, keeping previous data: {e}")
+                return data
+            return self._data
+
+    def is_valid(self, code: str) -> bool:
+        if not code:
+            return False
+        return code.upper() in self.get().codes
+
+countries = CountryRegistry()
+
+def is_valid_country_code(code: str) -> bool:
+    try:
+        return countries.is_valid(code)
+    except Exception as e:
+        print(f"Error loading country codes: {e}")
+        return False
+
+def license_type_flag(license_type: str) -> Optional[int]:
+    return LICENSE_TYPES.get((license_type or "").lower())
@@ -0,0 +1,339 @@
+const licenseModal = document.getElementById('licenseModal');
+const responseModal = document.getElementById('responseModal');
+const alertEl = document.getElementById('customAlert');
+const alertMsg = document.getElementById('customAlertMessage');
+let alertTimeout;
+let deleteIdToConfirm = null;
+
+function openModal() {
+    licenseModal.style.display = 'block';
+}
+
+function closeModal() {
+    licenseModal.style.display = 'none';
+}
+
+function closeResponseModal() {
+    responseModal.style.display = 'none';
+}
+
+function showAlert(message, type = 'success') {
+    clearTimeout(alertTimeout);
+    alertEl.style.backgroundColor = type === 'error' ? '#f44336' : '#4caf50';
+    alertMsg.textContent = message;
+    alertEl.classList.add('show');
+    alertTimeout = setTimeout(hideAlert, 3500);
+}
+
+function hideAlert() {
+    alertEl.classList.remove('show');
+}
+
+function validateLicenseForm(form) {
+    const countrycode = form.countrycode.value.trim();
+    const companyname = form.companyname.value.trim();
+    const license_type = form.license_type.value;
+    const hash_value = form.hash_value.value.trim();
+    const device_limit = form.device_limit.value.trim();
+    const validity = form.validity.value.trim();
+
+    if (!countrycode.match(/^[A-Z]+$/)) {
+        showAlert('Country Code must be uppercase letters only.', 'error');
+        return false;
+    }
+    if (!companyname.match(/^[A-Za-z]+$/)) {
+        showAlert('Company Name must contain only letters (no spaces).', 'error');
+        return false;
+    }
+    if (!license_type) {
+        showAlert('Please select a License Type.', 'error');
+        return false;
+    }
+    if (!hash_value.match(/^[0-9]+$/)) {
+        showAlert('Hash must be numbers only.', 'error');
+        return false;
+    }
+    if (!device_limit.match(/^[0-9]+$/) || parseInt(device_limit) <= 0) {
+        showAlert('Device Limit must be a positive number.', 'error');
+        return false;
+    }
+    if (!validity.match(/^[0-9]+$/) || parseInt(validity) <= 0) {
+        showAlert('Validity must be a positive number.', 'error');
+        return false;
+    }
+    return true;
+}
+
+document.querySelector('.license-form').addEventListener('submit', async (e) => {
+    e.preventDefault();
+    if (!validateLicenseForm(e.target)) return;
+
+    const formData = new FormData(e.target);
+    const params = new URLSearchParams();
+    formData.forEach((v, k) => params.append(k, v));
+
+    try {
+        const res = await fetch('/add_license', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
+            body: params.toString()
+        });
+
+        if (!res.ok) {
+            let msg = 'Server error';
+            try {
+                const errData = await res.json();
+                if (errData.message) {
+                    msg = errData.message;
+                } else if (errData.detail) {
+                    msg = Array.isArray(errData.detail)
+                        ? errData.detail.map(d => d.msg).join(', ')
+                        : errData.detail;
+                }
+            } catch { }
+            throw new Error(msg);
+        }
+
+        const data = await res.json();
+        document.getElementById('responseCompany').textContent = data.company_name;
+        document.getElementById('responseValidfrom').textContent = data.valid_from;
+        document.getElementById('responseValidtill').textContent = data.valid_till;
+        document.getElementById('responseToken').textContent = data.license_token;
+        responseModal.style.display = 'block';
+        showAlert('License created successfully!');
+        e.target.reset();
+        closeModal();
+        await refreshLicenseTable();
+    } catch (err) {
+        showAlert(err.message, 'error');
+    }
+});
+
+function copyToken() {
+    const tokenText = document.getElementById('responseToken').textContent;
+    navigator.clipboard.writeText(tokenText).then(() => {
+        showAlert('Token copied to clipboard!');
+    });
+}
+
+window.onclick = (e) => {
+    if (e.target === licenseModal) closeModal();
+    if (e.target === responseModal) closeResponseModal();
+    if (e.target === document.getElementById('confirmDeleteModal')) closeConfirmDelete();
+    if (e.target === document.getElementById('licenseDetailModal')) closeLicenseDetail();
+    if (e.target === document.getElementById('editLicenseModal')) closeEditModal();
+};
+window.onload = function () {
+    refreshLicenseTable();
+    loadCountryCodes();
+};
+
+async function loadCountryCodes() {
+    try {
+        const res = await fetch('/countries');
+        if (!res.ok) return;
+        const countries = await res.json();
+        const datalist = document.getElementById('countryCodes');
+        datalist.innerHTML = '';
+        countries.forEach(country => {
+            const option = document.createElement('option');
+            option.value = country.code;
+            option.label = country.name;
+            datalist.appendChild(option);
+        });
+    } catch (err) {
+        console.error('Failed to load country codes', err);
+    }
+}
+
+
+async function refreshLicenseTable() {
+    const tbody = document.getElementById('licenseTableBody');
+    tbody.innerHTML = `
+        <tr id="loadingIndicator">
+            <td colspan="9" style="text-align:center; padding: 40px 0;">
+                <span>Loading...</span>
+            </td>
+        </tr>
+    `;
+
+    try {
+        const res = await fetch('/get_licenses');
+        if (res.status === 401) {
+            window.location.href = '/';
+            return;
+        }
+        if (!res.ok) throw new Error('Failed to fetch licenses');
+        const licenses = await res.json();
+        tbody.innerHTML = '';
+
+        if (licenses.length === 0) {
+            tbody.innerHTML = `
+            <tr>
+                <td colspan="11" style="text-align:center; color:#888; font-size:1.1em;">
+                    No data found
+                </td>
+            </tr>
+        `;
+            return;
+        }
+
+        licenses.forEach((license, idx) => {
+            const row = document.createElement('tr');
+            row.innerHTML = `
+            <td>${license.id}</td>
+            <td class="hash-cell">${license.hash_value}</td>
+            <td>${license.companyname}</td>
+            <td>
+                <img src="https://flagcdn.com/24x18/${license.countrycode.toLowerCase()}.png"  
+                style="vertical-align:middle; margin-right:6px;" />
+                ${license.countrycode}
+            </td>
+            <td>${license.license_type}</td>
+            <td>${license.device_limit}</td>
+            <td>${license.validity}days</td>
+            <td class="date-cell">${license.valid_from}</td>
+            <td class="date-cell">${license.valid_till}</td>
+            <td class="status-${license.status.toLowerCase()}">${license.status}</td>
+            <td class="date-cell">${license.activation_time ? license.activation_time : ''}</td>
+            <td>${license.activated_by ? license.activated_by : ''}</td>
+            <td class="actions">
+                <button class="btn view" onclick="viewDetail('${license.id}')"><i class="fa-solid fa-eye"></i></button>
+                <button class="btn edit" onclick="openEditModal('${license.id}')"><i class="fa-solid fa-pen"></i></button>
+                <button class="btn delete" onclick="openConfirmDelete('${license.id}')"><i class="fa-solid fa-trash"></i></button>
+            </td>
+        `;
+            tbody.appendChild(row);
+        });
+    } catch (error) {
+        showAlert(error.message, 'error');
+    }
+}
+let editLicenseId = null;
+
+function openEditModal(id) {
+    fetch(`/view_license/${id}`)
+        .then(res => {
+            if (!res.ok) throw new Error('Failed to fetch license details');
+            return res.json();
+        })
+        .then(data => {
+            editLicenseId = id;
+            document.getElementById('editLicenseId').value = id;
+            document.getElementById('editLicenseType').value = data.license_type;
+            document.getElementById('editDeviceLimit').value = data.device_limit;
+            document.getElementById('editValidity').value = data.validity;
+            document.getElementById('editLicenseModal').style.display = 'block';
+        })
+        .catch(err => {
+            showAlert(err.message, 'error');
+        });
+}
+
+function closeEditModal() {
+    document.getElementById('editLicenseModal').style.display = 'none';
+    editLicenseId = null;
+}
+
+document.getElementById('editLicenseForm').addEventListener('submit', async function (e) {
+    e.preventDefault();
+    const license_id = document.getElementById('editLicenseId').value;
+    const license_type = document.getElementById('editLicenseType').value;
+    const device_limit = document.getElementById('editDeviceLimit').value;
+    const validity = document.getElementById('editValidity').value;
+
+    try {
+        const res = await fetch(`/edit_license/${license_id}`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
+            body: `license_type=${encodeURIComponent(license_type)}&device_limit=${encodeURIComponent(device_limit)}&validity=${encodeURIComponent(validity)}`
+        });
+        if (!res.ok) {
+            let msg = 'Server error';
+            try {
+                const errData = await res.json();
+                if (errData.message) {
+                    msg = errData.message;
+                } else if (errData.detail) {
+                    msg = Array.isArray(errData.detail)
+                        ? errData.detail.map(d => d.msg).join(', ')
+                        : errData.detail;
+                }
+            } catch { }
+            throw new Error(msg);
+        }
+        const data = await res.json();
+        document.getElementById('responseCompany').textContent = data.company_name;
+        document.getElementById('responseValidfrom').textContent = data.valid_from;
+        document.getElementById('responseValidtill').textContent = data.valid_till;
+        document.getElementById('responseToken').textContent = data.license_token;
+        responseModal.style.display = 'block';
+        e.target.reset();
+        closeModal();
+        showAlert('License updated successfully!');
+        closeEditModal();
+        await refreshLicenseTable();
+    } catch (err) {
+        showAlert(err.message, 'error');
+    }
+});
+
+function openConfirmDelete(id) {
+    deleteIdToConfirm = id;
+    document.getElementById('confirmDeleteModal').style.display = 'block';
+}
+
+function closeConfirmDelete() {
+    document.getElementById('confirmDeleteModal').style.display = 'none';
+    deleteIdToConfirm = null;
+}
+
+document.getElementById('confirmDeleteBtn').addEventListener('click', async () => {
+    if (!deleteIdToConfirm) return;
+
+    try {
+        const res = await fetch(`/delete_license/${deleteIdToConfirm}`, {
+            method: 'DELETE'
+        });
+
+        if (!res.ok) throw new Error('Failed to delete license');
+
+        const data = await res.json();
+        showAlert(data.message);
+        await refreshLicenseTable();
+    } catch (err) {
+        showAlert('Error: ' + err.message, 'error');
+    } finally {
+        closeConfirmDelete();
+    }
+});
+
+function viewDetail(id) {
+    fetch(`/view_license/${id}`)
+        .then(res => {
+            if (!res.ok) throw new Error('Failed to fetch license details');
+            return res.json();
+        })
+        .then(data => {
+            document.getElementById('detailCompanyName').textContent = data.companyname || '-';
+            document.getElementById('detailCountryCode').textContent = data.countrycode || '-';
+            document.getElementById('detailLicenseType').textContent = data.license_type || '-';
+            document.getElementById('detailHashValue').textContent = data.hash_value || '-';
+            document.getElementById('detailDeviceLimit').textContent = data.device_limit || '-';
+            document.getElementById('detailValidity').textContent = data.validity || '-';
+            document.getElementById('detailValidfrom').textContent = data.valid_from || '-';
+            document.getElementById('detailValidtill').textContent = data.valid_till || '-';
+            document.getElementById('detailEmail').textContent = data.activated_by || '-';
+            document.getElementById('detailActivation').textContent = data.activation_time || '-';
+            document.getElementById('detaillicensetoken').textContent = data.token || '-';
+
+            document.getElementById('licenseDetailModal').style.display = 'block';
+        })
+        .catch(err => {
+            showAlert('Error: ' + err.message, 'error');
+        });
+}
+
+function closeLicenseDetail() {
+    document.getElementById('licenseDetailModal').style.display = 'none';
+}